@@ -44,22 +44,34 @@ class dMRIPlot(object):
 
     def __init__(self, sliceqc_file, mask_file, confounds, usecols=None, units=None, vlines=None,
                  spikes_files=None, min_slice_size_percentile=10.0):
+        self._sliceqc_file = sliceqc_file
+        self._mask_file = mask_file
+        self._qc_data = None
+        self.confounds = confounds
+
+    @property
+    def qc_data(self):
+        """Slice QC scores and counts, loaded on first access"""
+        if self._qc_data is not None:
+            return self._qc_data
+
+        sliceqc_file = self._sliceqc_file
         if sliceqc_file.endswith(".npz") or sliceqc_file.endswith(".npy"):
-            self.qc_data = np.load(sliceqc_file)
+            # npz archives are read lazily per key; npy arrays are memory-mapped
+            self._qc_data = np.load(sliceqc_file, mmap_mode='r')
         else:
             # Load the info from eddy
             slice_scores = np.loadtxt(sliceqc_file, skiprows=1)
             # Get the slice counts
-            mask_img = nb.load(mask_file)
+            mask_img = nb.load(self._mask_file)
             mask = mask_img.get_data() > 0
             masked_slices = (mask * np.arange(mask_img.shape[2])[np.newaxis, np.newaxis, :]
                              ).astype(np.int)
             slice_nums, slice_counts = np.unique(masked_slices[mask], return_counts=True)
-            self.qc_data = {
+            self._qc_data = {
                 'slice_scores': slice_scores,
                 'slice_counts': slice_counts}
-
-        self.confounds = confounds
+        return self._qc_data
 
     def plot(self, figure=None):
         """Main plotter"""
@@ -70,20 +82,21 @@ class dMRIPlot(object):
             figure = plt.gcf()
 
         to_plot = ["bval", "hmc_xcorr", "framewise_displacement"]
-        confound_names = [p for p in to_plot if p in self.confounds.columns]
+        columns = set(self.confounds.columns)
+        confound_names = [p for p in to_plot if p in columns]
         nconfounds = len(confound_names)
         nrows = 1 + nconfounds
 
         # Create grid
         grid = mgs.GridSpec(nrows, 1, wspace=0.0, hspace=0.05,
-                            height_ratios=[1] * (nrows - 1) + [5])
+                            height_ratios=(1,) * (nrows - 1) + (5,))
 
         grid_id = 0
         palette = color_palette("husl", nconfounds)
 
+        series_map = {name: self.confounds[name].values for name in confound_names}
         for i, name in enumerate(confound_names):
-            tseries = self.confounds[name]
-            confoundplot(tseries, grid[grid_id], color=palette[i], name=name)
+            confoundplot(series_map[name], grid[grid_id], color=palette[i], name=name)
             grid_id += 1
 
         plot_sliceqc(self.qc_data['slice_scores'].T, self.qc_data['slice_counts'],
@@ -93,7 +106,7 @@ class dMRIPlot(object):
 
 def plot_sliceqc(slice_data, nperslice, size=(950, 800),
                  subplot=None, title=None, output_file=None,
-                 lut=None, tr=None):
+                 lut=None, tr=None, max_frames=2000):
     """
     Plot an image representation of voxel intensities across time also know
     as the "carpet plot" or "Power plot". See Jonathan Power Neuroimage
@@ -117,6 +130,9 @@ def plot_sliceqc(slice_data, nperslice, size=(950, 800),
         tr : float , optional
             Specify the TR, if specified it uses this value. If left as None,
             # Frames is plotted instead of time.
+        max_frames : int, optional
+            Maximum number of volumes drawn in the carpet plot. Longer series
+            are decimated in the time direction before plotting.
     """
 
     # Define TR and number of frames
@@ -125,12 +141,16 @@ def plot_sliceqc(slice_data, nperslice, size=(950, 800),
         notr = True
         tr = 1.
 
+    # Decimate the time direction down to display resolution
+    t_dec = max(1, slice_data.shape[1] // max_frames)
+    slice_data = slice_data[:, ::t_dec]
+
     # If subplot is not defined
     if subplot is None:
         subplot = mgs.GridSpec(1, 1)[0]
 
     # Define nested GridSpec
-    wratios = [1, 100]
+    wratios = (1, 100)
     gs = mgs.GridSpecFromSubplotSpec(1, 2, subplot_spec=subplot,
                                      width_ratios=wratios,
                                      wspace=0.0)
@@ -154,14 +174,14 @@ def plot_sliceqc(slice_data, nperslice, size=(950, 800),
 
     # Set 10 frame markers in X axis
     interval = max((int(slice_data.shape[1] + 1) // 10, int(slice_data.shape[1] + 1) // 5, 1))
-    xticks = list(range(0, slice_data.shape[1])[::interval])
+    xticks = np.arange(0, slice_data.shape[1], interval)
     ax1.set_xticks(xticks)
     if notr:
         ax1.set_xlabel('time (frame #)')
     else:
         ax1.set_xlabel('time (s)')
-    labels = tr * (np.array(xticks))
-    ax1.set_xticklabels(['%.02f' % t for t in labels.tolist()], fontsize=5)
+    labels = tr * xticks * t_dec
+    ax1.set_xticklabels(np.char.mod('%.02f', labels), fontsize=5)
 
     # Remove and redefine spines
     for side in ["top", "right"]:
@@ -179,7 +199,9 @@ def plot_sliceqc(slice_data, nperslice, size=(950, 800),
 
     if output_file is not None:
         figure = plt.gcf()
-        figure.savefig(output_file, bbox_inches='tight')
+        # Tighten once up front rather than letting savefig render twice
+        figure.tight_layout()
+        figure.savefig(output_file)
         plt.close(figure)
         figure = None
         return output_file
@@ -197,7 +219,7 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
         notr = True
         tr = 1.
     ntsteps = len(tseries)
-    tseries = np.array(tseries)
+    tseries = np.asarray(tseries)
 
     # Define nested GridSpec
     gs = mgs.GridSpecFromSubplotSpec(1, 2, subplot_spec=gs_ts,
@@ -208,7 +230,7 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
 
     # Set 10 frame markers in X axis
     interval = max((ntsteps // 10, ntsteps // 5, 1))
-    xticks = list(range(0, ntsteps)[::interval])
+    xticks = np.arange(0, ntsteps, interval)
     ax_ts.set_xticks(xticks)
 
     if not hide_x:
@@ -216,8 +238,8 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
             ax_ts.set_xlabel('time (frame #)')
         else:
             ax_ts.set_xlabel('time (s)')
-            labels = tr * np.array(xticks)
-            ax_ts.set_xticklabels(['%.02f' % t for t in labels.tolist()])
+            labels = tr * xticks
+            ax_ts.set_xticklabels(np.char.mod('%.02f', labels))
     else:
         ax_ts.set_xticklabels([])
 
@@ -253,13 +275,16 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
 
     nonnan = tseries[~np.isnan(tseries)]
     if nonnan.size > 0:
+        minv = nonnan.min()
+        maxv = nonnan.max()
+
         # Calculate Y limits
-        def_ylims = [nonnan.min() - 0.1 * abs(nonnan.min()), 1.1 * nonnan.max()]
-        if ylims is not None:
-            if ylims[0] is not None:
-                def_ylims[0] = min([def_ylims[0], ylims[0]])
-            if ylims[1] is not None:
-                def_ylims[1] = max([def_ylims[1], ylims[1]])
+        if ylims is None:
+            ylims = (None, None)
+        lo = minv - 0.1 * abs(minv)
+        hi = 1.1 * maxv
+        def_ylims = [lo if ylims[0] is None else min(lo, ylims[0]),
+                     hi if ylims[1] is None else max(hi, ylims[1])]
 
         # Add space for plot title and mean/SD annotation
         def_ylims[0] -= 0.1 * (def_ylims[1] - def_ylims[0])
@@ -267,7 +292,6 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
         ax_ts.set_ylim(def_ylims)
 
         # Annotate stats
-        maxv = nonnan.max()
         mean = nonnan.mean()
         stdv = nonnan.std()
         p95 = np.percentile(nonnan, 95.0)
@@ -289,7 +313,7 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
     )
 
     # Annotate percentile 95
-    ax_ts.plot((0, ntsteps - 1), [p95] * 2, linewidth=.1, color='lightgray')
+    ax_ts.axhline(p95, linewidth=.1, color='lightgray')
     ax_ts.annotate(
         '%.2f' % p95, xy=(0, p95), xytext=(-1, 0),
         textcoords='offset points', va='center', ha='right',
@@ -299,8 +323,7 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
         cutoff = []
 
     for i, thr in enumerate(cutoff):
-        ax_ts.plot((0, ntsteps - 1), [thr] * 2,
-                   linewidth=.2, color='dimgray')
+        ax_ts.axhline(thr, linewidth=.2, color='dimgray')
 
         ax_ts.annotate(
             '%.2f' % thr, xy=(0, thr), xytext=(-1, 0),
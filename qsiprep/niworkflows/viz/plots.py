@@ -10,8 +10,9 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib import gridspec as mgs
 import matplotlib.cm as cm
-from matplotlib.colors import ListedColormap, Normalize
+from matplotlib.colors import ListedColormap
 from matplotlib.colorbar import ColorbarBase
+from matplotlib.collections import LineCollection
 
 from nilearn.plotting import plot_img
 from nilearn.signal import clean
@@ -222,14 +223,14 @@ def plot_carpet(img, atlaslabels, detrend=True, nskip=0, size=(950, 800),
 
     # Set 10 frame markers in X axis
     interval = max((int(data.shape[-1] + 1) // 10, int(data.shape[-1] + 1) // 5, 1))
-    xticks = list(range(0, data.shape[-1])[::interval])
+    xticks = np.arange(0, data.shape[-1], interval)
     ax1.set_xticks(xticks)
     if notr:
         ax1.set_xlabel('time (frame #)')
     else:
         ax1.set_xlabel('time (s)')
-    labels = tr * (np.array(xticks)) * t_dec
-    ax1.set_xticklabels(['%.02f' % t for t in labels.tolist()], fontsize=5)
+    labels = tr * xticks * t_dec
+    ax1.set_xticklabels(np.char.mod('%.02f', labels), fontsize=5)
 
     # Remove and redefine spines
     for side in ["top", "right"]:
@@ -295,15 +296,24 @@ def spikesplot(ts_z, outer_gs=None, tr=None, zscored=True, spike_thresh=6., titl
 
     # Load a colormap
     my_cmap = cm.get_cmap(cmap)
-    norm = Normalize(vmin=0, vmax=float(nslices - 1))
-    colors = [my_cmap(norm(sl)) for sl in range(nslices)]
-
-    stem = len(np.unique(ts_z).tolist()) == 2
-    # Plot one line per axial slice timeseries
-    for sl in range(nslices):
-        if not stem:
-            ax.plot(ts_z[sl, :], color=colors[sl], lw=0.5)
-        else:
+    colors = my_cmap(np.linspace(0., 1., nslices))
+
+    # Use stems for binary series. A small sample rules out most inputs
+    # before the full O(N) check, avoiding a sort of the whole array.
+    flat = ts_z.ravel()
+    stem = np.unique(flat[:256]).size <= 2
+    if stem:
+        lo, hi = flat.min(), flat.max()
+        stem = bool(lo != hi and not np.any((flat != lo) & (flat != hi)))
+    if not stem:
+        # Plot all axial slice timeseries as a single collection
+        segments = np.stack(
+            [np.broadcast_to(np.arange(ntsteps), (nslices, ntsteps)), ts_z], axis=-1)
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=0.5))
+        ax.autoscale_view()
+    else:
+        # Plot one stem per axial slice timeseries
+        for sl in range(nslices):
             markerline, stemlines, baseline = ax.stem(ts_z[sl, :])
             plt.setp(markerline, 'markerfacecolor', colors[sl])
             plt.setp(baseline, 'color', colors[sl], 'linewidth', 1)
@@ -323,32 +333,31 @@ def spikesplot(ts_z, outer_gs=None, tr=None, zscored=True, spike_thresh=6., titl
             ax.set_xlabel('time (frame #)')
         else:
             ax.set_xlabel('time (s)')
-            ax.set_xticklabels(
-                ['%.02f' % t for t in (tr * np.array(xticks)).tolist()])
+            ax.set_xticklabels(np.char.mod('%.02f', tr * np.asarray(xticks)))
 
     # Handle Y axis
     ylabel = 'slice-wise noise average on background'
     if zscored:
         ylabel += ' (z-scored)'
-        zs_max = np.abs(ts_z).max()
-        ax.set_ylim((-(np.abs(ts_z[:, nskip:]).max()) * 1.05,
-                     (np.abs(ts_z[:, nskip:]).max()) * 1.05))
+        zs_max = float(np.abs(ts_z[:, nskip:]).max())
+        ax.set_ylim((-zs_max * 1.05, zs_max * 1.05))
 
         ytick_vals = np.arange(0.0, zs_max, float(np.floor(zs_max / 2.)))
-        yticks = list(
-            reversed((-1.0 * ytick_vals[ytick_vals > 0]).tolist())) + ytick_vals.tolist()
+        yticks = np.concatenate((-ytick_vals[ytick_vals > 0][::-1], ytick_vals))
 
         # TODO plot min/max or mark spikes
         # yticks.insert(0, ts_z.min())
         # yticks += [ts_z.max()]
-        for val in ytick_vals:
-            ax.plot((0, ntsteps - 1), (-val, -val), 'k:', alpha=.2)
-            ax.plot((0, ntsteps - 1), (val, val), 'k:', alpha=.2)
+        grid_segments = np.stack(
+            (np.column_stack((np.zeros_like(yticks), yticks)),
+             np.column_stack((np.full_like(yticks, ntsteps - 1), yticks))), axis=1)
+        ax.add_collection(LineCollection(
+            grid_segments, colors='k', linestyles=':', alpha=.2))
 
         # Plot spike threshold
         if zs_max < spike_thresh:
-            ax.plot((0, ntsteps - 1), (-spike_thresh, -spike_thresh), 'k:')
-            ax.plot((0, ntsteps - 1), (spike_thresh, spike_thresh), 'k:')
+            ax.axhline(-spike_thresh, color='k', linestyle=':')
+            ax.axhline(spike_thresh, color='k', linestyle=':')
     else:
         yticks = [ts_z[:, nskip:].min(),
                   np.median(ts_z[:, nskip:]),
@@ -422,7 +431,7 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
         notr = True
         tr = 1.
     ntsteps = len(tseries)
-    tseries = np.array(tseries)
+    tseries = np.asarray(tseries)
 
     # Define nested GridSpec
     gs = mgs.GridSpecFromSubplotSpec(1, 2, subplot_spec=gs_ts,
@@ -433,7 +442,7 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
 
     # Set 10 frame markers in X axis
     interval = max((ntsteps // 10, ntsteps // 5, 1))
-    xticks = list(range(0, ntsteps)[::interval])
+    xticks = np.arange(0, ntsteps, interval)
     ax_ts.set_xticks(xticks)
 
     if not hide_x:
@@ -441,8 +450,8 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
             ax_ts.set_xlabel('time (frame #)')
         else:
             ax_ts.set_xlabel('time (s)')
-            labels = tr * np.array(xticks)
-            ax_ts.set_xticklabels(['%.02f' % t for t in labels.tolist()])
+            labels = tr * xticks
+            ax_ts.set_xticklabels(np.char.mod('%.02f', labels))
     else:
         ax_ts.set_xticklabels([])
 
@@ -478,13 +487,16 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
 
     nonnan = tseries[~np.isnan(tseries)]
     if nonnan.size > 0:
+        minv = nonnan.min()
+        maxv = nonnan.max()
+
         # Calculate Y limits
-        def_ylims = [nonnan.min() - 0.1 * abs(nonnan.min()), 1.1 * nonnan.max()]
-        if ylims is not None:
-            if ylims[0] is not None:
-                def_ylims[0] = min([def_ylims[0], ylims[0]])
-            if ylims[1] is not None:
-                def_ylims[1] = max([def_ylims[1], ylims[1]])
+        if ylims is None:
+            ylims = (None, None)
+        lo = minv - 0.1 * abs(minv)
+        hi = 1.1 * maxv
+        def_ylims = [lo if ylims[0] is None else min(lo, ylims[0]),
+                     hi if ylims[1] is None else max(hi, ylims[1])]
 
         # Add space for plot title and mean/SD annotation
         def_ylims[0] -= 0.1 * (def_ylims[1] - def_ylims[0])
@@ -492,7 +504,6 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
         ax_ts.set_ylim(def_ylims)
 
         # Annotate stats
-        maxv = nonnan.max()
         mean = nonnan.mean()
         stdv = nonnan.std()
         p95 = np.percentile(nonnan, 95.0)
@@ -514,7 +525,7 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
     )
 
     # Annotate percentile 95
-    ax_ts.plot((0, ntsteps - 1), [p95] * 2, linewidth=.1, color='lightgray')
+    ax_ts.axhline(p95, linewidth=.1, color='lightgray')
     ax_ts.annotate(
         '%.2f' % p95, xy=(0, p95), xytext=(-1, 0),
         textcoords='offset points', va='center', ha='right',
@@ -524,8 +535,7 @@ def confoundplot(tseries, gs_ts, gs_dist=None, name=None,
         cutoff = []
 
     for i, thr in enumerate(cutoff):
-        ax_ts.plot((0, ntsteps - 1), [thr] * 2,
-                   linewidth=.2, color='dimgray')
+        ax_ts.axhline(thr, linewidth=.2, color='dimgray')
 
         ax_ts.annotate(
             '%.2f' % thr, xy=(0, thr), xytext=(-1, 0),